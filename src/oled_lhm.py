@@ -21,18 +21,26 @@ License: MIT
 
 from __future__ import annotations
 
-import datetime
-import json
+import atexit
+import ctypes
 import os
+import re
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Callable, Dict, Optional
 
 import psutil
 import requests
-import schedule
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json also accepts bytes
+    import json as orjson  # type: ignore[no-redef]
 
 # ============================================================
 # CONFIG
@@ -126,17 +134,80 @@ ensure_single_instance()
 # Logging
 # ============================================================
 
+_LOG_FH = None  # opened on first write, kept open (line-buffered)
+
+
 def log(message: str) -> None:
-    ts = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    line = f"[{ts}] {message}"
+    global _LOG_FH
+    line = f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] {message}"
     print(line)
     if LOG_TO_FILE:
         try:
-            os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
-            with open(LOG_FILE, "a", encoding="utf-8") as f:
-                f.write(line + "\n")
+            if _LOG_FH is None:
+                os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
+                _LOG_FH = open(LOG_FILE, "a", encoding="utf-8", buffering=1)
+                atexit.register(_LOG_FH.close)
+            _LOG_FH.write(line + "\n")
+        except Exception:
+            pass
+
+
+# ============================================================
+# HTTP session (keep-alive for LHM + GameSense)
+# ============================================================
+
+def _new_session(retry_5xx: bool = False) -> requests.Session:
+    """
+    Creates a pooled session so periodic calls reuse localhost connections
+    instead of opening a new TCP connection on every request.
+    With retry_5xx, 502/503/504 responses are retried by urllib3 on the pooled
+    connection. Connection errors and timeouts are never retried.
+    """
+    max_retries: Any = 0
+    if retry_5xx:
+        max_retries = Retry(
+            total=None,
+            connect=0,
+            read=False,  # surface read timeouts as requests.ReadTimeout (no rebind)
+            redirect=0,
+            other=0,
+            status=2,
+            backoff_factor=0.1,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=None,  # GameSense calls are POSTs
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+    session = requests.Session()
+    session.headers["Connection"] = "keep-alive"
+    session.mount(
+        "http://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=max_retries)
+    )
+    return session
+
+
+# GameSense POSTs via safe_post
+_SESSION = _new_session(retry_5xx=True)
+
+# Liveness probes (GameSense heartbeat, LHM readiness): fail fast, no retries
+_PROBE_SESSION = _new_session()
+
+# Used only by the LHM prefetch thread (never reset from the main thread)
+_LHM_SESSION = _new_session()
+
+
+def reset_session() -> None:
+    """
+    Drops pooled connections (e.g., to an old GameSense port) and starts fresh.
+    """
+    global _SESSION, _PROBE_SESSION
+    for session in (_SESSION, _PROBE_SESSION):
+        try:
+            session.close()
         except Exception:
             pass
+    _SESSION = _new_session(retry_5xx=True)
+    _PROBE_SESSION = _new_session()
 
 
 # ============================================================
@@ -145,8 +216,11 @@ def log(message: str) -> None:
 
 _current_base: Optional[str] = None
 _last_base_read: float = 0.0
+_base_alive_until: float = 0.0  # time.monotonic() until which GameSense counts as alive
 _last_rebind: float = 0.0
-_counter: int = 0
+
+# Last parsed coreProps.json: path, st_mtime_ns and resulting base URL
+_COREPROPS_CACHE: Dict[str, Any] = {"path": None, "mtime": 0, "base": None}
 
 
 def read_coreprops_address() -> Optional[str]:
@@ -157,12 +231,21 @@ def read_coreprops_address() -> Optional[str]:
     for p in COREPROPS_PATHS:
         try:
             cp = Path(p)
-            if not cp.exists():
+            try:
+                mtime = cp.stat().st_mtime_ns
+            except OSError:
                 continue
-            data = json.loads(cp.read_text(encoding="utf-8"))
+
+            # Unchanged since last parse (file is rewritten only when GG starts)
+            if _COREPROPS_CACHE["path"] == p and _COREPROPS_CACHE["mtime"] == mtime:
+                return _COREPROPS_CACHE["base"]
+
+            data = orjson.loads(cp.read_bytes())
             addr = data.get("address")
             if addr:
-                return f"http://{addr}"
+                base = f"http://{addr}"
+                _COREPROPS_CACHE.update(path=p, mtime=mtime, base=base)
+                return base
         except Exception:
             continue
     return None
@@ -173,12 +256,20 @@ def is_gamesense_alive(base: str) -> bool:
     Tests whether GameSense HTTP API is reachable.
     """
     try:
-        r = requests.post(f"{base}/game_heartbeat", json={"game": "PING"}, timeout=1.2)
+        r = _PROBE_SESSION.post(f"{base}/game_heartbeat", json={"game": "PING"}, timeout=1.2)
         return r.status_code in (200, 204)
     except Exception:
         return False
 
 
+def _mark_alive() -> None:
+    """
+    Records a successful GameSense round-trip (probe or real POST).
+    """
+    global _base_alive_until
+    _base_alive_until = time.monotonic() + 3
+
+
 def get_current_base(force: bool = False) -> Optional[str]:
     """
     Returns a working GameSense base URL.
@@ -194,9 +285,18 @@ def get_current_base(force: bool = False) -> Optional[str]:
     base = read_coreprops_address()
     _last_base_read = now
 
-    if base and is_gamesense_alive(base):
+    # Same base that answered recently: no need for another probe
+    recently_alive = (
+        not force and base == _current_base and time.monotonic() < _base_alive_until
+    )
+
+    if base and (recently_alive or is_gamesense_alive(base)):
+        if not recently_alive:
+            _mark_alive()
         if base != _current_base:
             log(f"GameSense base changed -> {base}")
+            if _current_base:
+                reset_session()
         _current_base = base
         return _current_base
 
@@ -206,13 +306,22 @@ def get_current_base(force: bool = False) -> Optional[str]:
 
 def gamesense_ok() -> bool:
     base = get_current_base()
-    return bool(base and is_gamesense_alive(base))
+    if not base:
+        return False
+    if time.monotonic() < _base_alive_until:
+        return True
+    if is_gamesense_alive(base):
+        _mark_alive()
+        return True
+    return False
 
 
 def safe_post(path: str, payload: Dict[str, Any]) -> Optional[requests.Response]:
     """
     POST to GameSense API using the currently detected base URL.
-    If it fails, optionally rebind/re-register.
+    If GameSense looks moved/restarted (connection refused or 4xx), optionally
+    rebind/re-register. Transient 5xx are retried by the session adapter;
+    timeouts just drop this POST.
     """
     global _last_rebind
     base = get_current_base()
@@ -220,15 +329,17 @@ def safe_post(path: str, payload: Dict[str, Any]) -> Optional[requests.Response]
         return None
 
     try:
-        r = requests.post(f"{base}{path}", json=payload, timeout=2)
-        if r.status_code >= 400 and AUTO_REBIND_ON_FAIL:
+        r = _SESSION.post(f"{base}{path}", json=payload, timeout=2)
+        if r.status_code < 300:
+            _mark_alive()
+        if 400 <= r.status_code < 500 and AUTO_REBIND_ON_FAIL:
             now = time.time()
             if now - _last_rebind > REBIND_COOLDOWN_SECONDS:
                 _last_rebind = now
                 log(f"POST {path} failed ({r.status_code}) -> rebind")
                 try_rebind()
         return r
-    except Exception as e:
+    except requests.ConnectionError as e:
         if AUTO_REBIND_ON_FAIL:
             now = time.time()
             if now - _last_rebind > REBIND_COOLDOWN_SECONDS:
@@ -237,6 +348,8 @@ def safe_post(path: str, payload: Dict[str, Any]) -> Optional[requests.Response]
                 get_current_base(force=True)
                 try_rebind()
         return None
+    except Exception:
+        return None
 
 
 def register_game() -> None:
@@ -283,29 +396,47 @@ def bind_all() -> None:
     bind_screen(RAM_EVENT)
 
 
+_rebinding = False
+
+
 def try_rebind() -> None:
+    global _LAST_RENDER, _rebinding
+    # A failing POST inside the rebind must not start another rebind
+    if _rebinding:
+        return
+    # Bindings are recreated, so the next render must redraw the OLED
+    _LAST_RENDER = None
+    _rebinding = True
     try:
         register_game()
         bind_all()
         log("Rebind done.")
     except Exception as e:
         log(f"Rebind failed: {e}")
+    finally:
+        _rebinding = False
 
 
-def send_screen(event_name: str, line1: str, line2: str) -> None:
-    global _counter
-    safe_post(
-        "/game_event",
-        {
-            "game": GAME,
-            "event": event_name,
-            "data": {
-                "value": _counter,
-                "frame": {"l1": (line1 or "")[:18], "l2": (line2 or "")[:18]},
-            },
-        },
-    )
-    _counter += 1
+# Pre-built /game_event payloads; send_screen only updates value + frame lines.
+# "value" must keep changing: GameSense may ignore repeated events with the same value.
+_EVENT_TEMPLATES: Dict[str, Dict[str, Any]] = {
+    ev: {"game": GAME, "event": ev, "data": {"value": 0, "frame": {"l1": "", "l2": ""}}}
+    for ev in (CPU_EVENT, GPU_EVENT, RAM_EVENT)
+}
+
+
+def send_screen(event_name: str, line1: str, line2: str) -> bool:
+    """
+    Sends one OLED frame. Returns True if GameSense accepted it.
+    """
+    payload = _EVENT_TEMPLATES[event_name]
+    data = payload["data"]
+    data["value"] += 1
+    frame = data["frame"]
+    frame["l1"] = (line1 or "")[:18]
+    frame["l2"] = (line2 or "")[:18]
+    r = safe_post("/game_event", payload)
+    return r is not None and r.status_code < 300
 
 
 def heartbeat() -> None:
@@ -317,9 +448,18 @@ def heartbeat() -> None:
 # ============================================================
 
 def is_lhm_ready(url: str) -> bool:
+    """
+    Checks only the head of data.json ("Children" appears in the root node),
+    so the full sensor payload is not downloaded for a liveness check.
+    """
     try:
-        r = requests.get(url, timeout=1.5)
-        return r.status_code == 200 and "Children" in r.text
+        with _PROBE_SESSION.get(
+            url, headers={"Range": "bytes=0-511"}, timeout=1.5, stream=True
+        ) as r:
+            if r.status_code not in (200, 206):
+                return False
+            # Servers ignoring Range send the full body; stream=True caps the read
+            return b"Children" in r.raw.read(512, decode_content=True)
     except Exception:
         return False
 
@@ -356,6 +496,10 @@ def wait_for_lhm(timeout_s: int) -> bool:
 # Formatting / rendering
 # ============================================================
 
+# Temperature unit suffix: 52°C / 52C
+_TEMP_UNIT = f"{DEGREE_SYMBOL}C" if USE_DEGREE_SYMBOL else "C"
+
+
 def fmt_pct(v: Optional[float]) -> str:
     return "?" if v is None else f"{int(round(v))}%"
 
@@ -377,22 +521,31 @@ def fmt_ghz_from_mhz(mhz: Optional[float]) -> str:
     return "?" if mhz is None else f"{mhz / 1000.0:.2f}GHz"
 
 
+# All possible bars, indexed by number of filled chars
+_BAR_CACHE = [
+    "[" + (BAR_FILLED * i) + (BAR_EMPTY * (BAR_WIDTH - i)) + "]" for i in range(BAR_WIDTH + 1)
+]
+
+
 def progress_bar(used: Optional[float], total: Optional[float]) -> str:
     """
     Returns an 18-character bar: [################] or [----...]
     """
     if used is None or total is None or total <= 0:
-        return "[" + (BAR_EMPTY * BAR_WIDTH) + "]"
+        return _BAR_CACHE[0]
     frac = max(0.0, min(1.0, used / total))
     filled = int(round(frac * BAR_WIDTH))
-    filled = max(0, min(BAR_WIDTH, filled))
-    return "[" + (BAR_FILLED * filled) + (BAR_EMPTY * (BAR_WIDTH - filled)) + "]"
+    return _BAR_CACHE[max(0, min(BAR_WIDTH, filled))]
 
 
 # ============================================================
 # LHM JSON parsing (tailored to typical LHM node structure)
 # ============================================================
 
+# First number in a value string, with "." or "," as decimal separator
+_NUM_RE = re.compile(r"-?\d+(?:[.,]\d+)?")
+
+
 def _to_float_best(val: Any) -> Optional[float]:
     """
     Converts strings like '52,6 °C' or '6,3 %' to float (52.6 / 6.3).
@@ -402,26 +555,199 @@ def _to_float_best(val: Any) -> Optional[float]:
     if isinstance(val, (int, float)):
         return float(val)
 
-    s = str(val).strip()
-    num = ""
-    for ch in s:
-        if ch.isdigit() or ch in ".-,":
-            num += ch
-        elif num:
-            break
-    if not num:
+    m = _NUM_RE.search(str(val))
+    if not m:
         return None
-    return float(num.replace(",", "."))
+    return float(m.group().replace(",", "."))
+
+
+# Sensor name (lowercase) -> [(unit substring, field)]
+# Names reported with several units (e.g. "GPU Core" as °C and %) list one rule per unit.
+_TARGETS: Dict[str, list[tuple[str, str]]] = {
+    # CPU
+    "core (tctl/tdie)": [("c", "cpu_temp")],
+    "cpu total": [("%", "cpu_load")],
+    "cores (average)": [("mhz", "cpu_clock_mhz")],
+    # GPU temp + load
+    "gpu core": [("c", "gpu_temp"), ("%", "gpu_core_load")],
+    "gpu hot spot": [("c", "gpu_hotspot")],
+    "d3d 3d": [("%", "d3d_3d")],
+    # VRAM
+    "gpu memory used": [("mb", "vram_used_mb")],
+    "gpu memory total": [("mb", "vram_total_mb")],
+}
+
+
+def _needed_fields() -> set[str]:
+    """
+    Fields that make every fallback unnecessary once found
+    (GPU Hot Spot and the non-preferred GPU load source are fallbacks only).
+    """
+    preferred_load = "gpu_core_load" if GPU_LOAD_SOURCE.lower() == "core" else "d3d_3d"
+    return {
+        "cpu_temp",
+        "cpu_load",
+        "cpu_clock_mhz",
+        "gpu_temp",
+        preferred_load,
+        "vram_used_mb",
+        "vram_total_mb",
+    }
 
 
-def walk_json(node: Any) -> Iterable[Dict[str, Any]]:
-    if isinstance(node, dict):
-        yield node
-        for v in node.values():
-            yield from walk_json(v)
-    elif isinstance(node, list):
-        for it in node:
-            yield from walk_json(it)
+def _fallback_fields() -> Dict[str, str]:
+    """
+    Needed field -> fallback used when it is missing or 0 (see lhm_read_metrics).
+    """
+    if GPU_LOAD_SOURCE.lower() == "core":
+        return {"gpu_temp": "gpu_hotspot", "gpu_core_load": "d3d_3d"}
+    return {"gpu_temp": "gpu_hotspot", "d3d_3d": "gpu_core_load"}
+
+
+JsonPath = tuple[Any, ...]
+
+# Field -> (path, lowercase sensor name, unit substring) where it was last found.
+# LHM keeps the same tree layout between reads, so later reads index directly.
+_PATH_CACHE: Dict[str, tuple[JsonPath, str, str]] = {}
+
+# Fields the last complete scan did not find (sensor absent, e.g. no
+# "Core (Tctl/Tdie)" on Intel). Cached reads stay valid without them, but
+# rescan every N reads (~1 min) so nodes LHM populates late still appear.
+_ALL_FIELDS = {field for rules in _TARGETS.values() for _, field in rules}
+_MISSING_FIELDS: set[str] = set()
+_RESCAN_EVERY_READS = 20
+_reads_since_scan = 0
+
+
+def _path_of(link: Any) -> JsonPath:
+    """
+    Rebuilds a path from a (parent link, key) chain (root link = None).
+    """
+    keys = []
+    while link is not None:
+        link, k = link
+        keys.append(k)
+    keys.reverse()
+    return tuple(keys)
+
+
+def _scan_sensors(data: Any) -> Dict[str, float]:
+    """
+    Full tree walk (pre-order, explicit stack); also refreshes _PATH_CACHE with
+    the path of every match.
+    """
+    global _reads_since_scan
+    found: Dict[str, float] = {}
+    _PATH_CACHE.clear()
+    _MISSING_FIELDS.clear()
+    _reads_since_scan = 0
+    fallbacks = _fallback_fields()
+    # Needed fields still unresolved: not found yet, or 0 with the fallback not found yet
+    pending = _needed_fields()
+
+    # Stack entries: (link, node). Links are (parent link, key) pairs, so a
+    # node's path is only built when it matches.
+    stack: list[tuple[Any, Any]] = [(None, data)]
+    while stack:
+        link, n = stack.pop()
+        if isinstance(n, list):
+            for i in range(len(n) - 1, -1, -1):
+                v = n[i]
+                if isinstance(v, (dict, list)):
+                    stack.append(((link, i), v))
+            continue
+        if not isinstance(n, dict):
+            continue
+
+        text = n.get("Text")
+        if text is not None:
+            lname = str(text).strip().lower()
+            rules = _TARGETS.get(lname)
+            val = n.get("Value")
+            if rules is not None and val is not None:
+                sval = str(val).strip().lower()
+                for unit, field in rules:
+                    if field not in found and unit in sval:
+                        v = _to_float_best(val)
+                        if v is not None:
+                            found[field] = v
+                            _PATH_CACHE[field] = (_path_of(link), lname, unit)
+                            pending = {
+                                f
+                                for f in pending
+                                if f not in found
+                                or (not found[f] and f in fallbacks and fallbacks[f] not in found)
+                            }
+
+                # Stop as soon as no fallback can change the result
+                if not pending:
+                    break
+
+        for k, v in reversed(n.items()):
+            if isinstance(v, (dict, list)):
+                stack.append(((link, k), v))
+    else:
+        # Walked the whole tree: anything not found is absent
+        _MISSING_FIELDS.update(_ALL_FIELDS - found.keys())
+
+    return found
+
+
+def _read_cached_sensors(data: Any) -> Optional[Dict[str, float]]:
+    """
+    Reads sensors at their cached paths.
+    Returns None (-> full scan) if there was no scan yet, a periodic rescan for
+    missing sensors is due, a fallback is needed but not located yet or any
+    cached node no longer matches.
+    """
+    global _reads_since_scan
+    if not _PATH_CACHE and not _MISSING_FIELDS:
+        return None
+    _reads_since_scan += 1
+    if _MISSING_FIELDS and _reads_since_scan >= _RESCAN_EVERY_READS:
+        return None
+
+    found: Dict[str, float] = {}
+    for field, (path, lname, unit) in _PATH_CACHE.items():
+        n = data
+        try:
+            for p in path:
+                n = n[p]
+        except (KeyError, IndexError, TypeError):
+            return None
+        if not isinstance(n, dict):
+            return None
+
+        text = n.get("Text")
+        val = n.get("Value")
+        if text is None or val is None:
+            return None
+        if str(text).strip().lower() != lname or unit not in str(val).lower():
+            return None
+        v = _to_float_best(val)
+        if v is None:
+            return None
+        found[field] = v
+
+    # A 0 value (e.g. idle D3D 3D) needs its fallback; rescan only if the
+    # early-exit scan stopped before locating it
+    for field, fallback in _fallback_fields().items():
+        if not found.get(field) and fallback not in found and fallback not in _MISSING_FIELDS:
+            return None
+
+    return found
+
+
+def _empty_lhm_metrics() -> Dict[str, Optional[float]]:
+    return {
+        "cpu_temp": None,
+        "cpu_load": None,
+        "cpu_clock_mhz": None,
+        "gpu_temp": None,
+        "gpu_load": None,
+        "vram_used_mb": None,
+        "vram_total_mb": None,
+    }
 
 
 def lhm_read_metrics() -> Dict[str, Optional[float]]:
@@ -437,59 +763,18 @@ def lhm_read_metrics() -> Dict[str, Optional[float]]:
         - GPU Memory Used/Total (MB)
     """
     try:
-        r = requests.get(LHM_DATAJSON_URL, timeout=2)
+        r = _LHM_SESSION.get(LHM_DATAJSON_URL, timeout=2)
         r.raise_for_status()
-        data = r.json()
+        data = orjson.loads(r.content)
     except Exception:
-        return {
-            "cpu_temp": None,
-            "cpu_load": None,
-            "cpu_clock_mhz": None,
-            "gpu_temp": None,
-            "gpu_load": None,
-            "vram_used_mb": None,
-            "vram_total_mb": None,
-        }
-
-    cpu_temp = cpu_load = cpu_clock_mhz = None
-    gpu_temp = gpu_hotspot = None
-    gpu_core_load = d3d_3d = None
-    vram_used_mb = vram_total_mb = None
-
-    for n in walk_json(data):
-        text = n.get("Text")
-        val = n.get("Value")
-        if text is None or val is None:
-            continue
+        return _empty_lhm_metrics()
+
+    found = _read_cached_sensors(data)
+    if found is None:
+        found = _scan_sensors(data)
 
-        lname = str(text).strip().lower()
-        sval = str(val).strip().lower()
-
-        # CPU
-        if cpu_temp is None and lname == "core (tctl/tdie)" and "c" in sval:
-            cpu_temp = _to_float_best(val)
-        if cpu_load is None and lname == "cpu total" and "%" in sval:
-            cpu_load = _to_float_best(val)
-        if cpu_clock_mhz is None and lname == "cores (average)" and "mhz" in sval:
-            cpu_clock_mhz = _to_float_best(val)
-
-        # GPU temp
-        if gpu_temp is None and lname == "gpu core" and "c" in sval:
-            gpu_temp = _to_float_best(val)
-        if gpu_hotspot is None and lname == "gpu hot spot" and "c" in sval:
-            gpu_hotspot = _to_float_best(val)
-
-        # GPU load
-        if gpu_core_load is None and lname == "gpu core" and "%" in sval:
-            gpu_core_load = _to_float_best(val)
-        if d3d_3d is None and lname == "d3d 3d" and "%" in sval:
-            d3d_3d = _to_float_best(val)
-
-        # VRAM
-        if vram_used_mb is None and lname == "gpu memory used" and "mb" in sval:
-            vram_used_mb = _to_float_best(val)
-        if vram_total_mb is None and lname == "gpu memory total" and "mb" in sval:
-            vram_total_mb = _to_float_best(val)
+    gpu_core_load = found.get("gpu_core_load")
+    d3d_3d = found.get("d3d_3d")
 
     # Select GPU load source
     if GPU_LOAD_SOURCE.lower() == "core":
@@ -498,16 +783,16 @@ def lhm_read_metrics() -> Dict[str, Optional[float]]:
         gpu_load = d3d_3d or gpu_core_load
 
     # Prefer core temp, fallback hotspot
-    gpu_temp_final = gpu_temp or gpu_hotspot
+    gpu_temp_final = found.get("gpu_temp") or found.get("gpu_hotspot")
 
     return {
-        "cpu_temp": cpu_temp,
-        "cpu_load": cpu_load,
-        "cpu_clock_mhz": cpu_clock_mhz,
+        "cpu_temp": found.get("cpu_temp"),
+        "cpu_load": found.get("cpu_load"),
+        "cpu_clock_mhz": found.get("cpu_clock_mhz"),
         "gpu_temp": gpu_temp_final,
         "gpu_load": gpu_load,
-        "vram_used_mb": vram_used_mb,
-        "vram_total_mb": vram_total_mb,
+        "vram_used_mb": found.get("vram_used_mb"),
+        "vram_total_mb": found.get("vram_total_mb"),
     }
 
 
@@ -515,75 +800,200 @@ def mb_to_gb(mb: Optional[float]) -> Optional[float]:
     return None if mb is None else mb / 1024.0
 
 
+# ============================================================
+# LHM background prefetch
+# ============================================================
+
+# Latest lhm_read_metrics() result, replaced as a whole by the prefetch thread
+_LATEST_LHM: Optional[Dict[str, Optional[float]]] = None
+_LHM_READY_EVT = threading.Event()
+
+
+def _lhm_prefetch_loop() -> None:
+    """
+    Fetches + parses LHM data.json off the scheduler thread, so HTTP latency
+    never delays heartbeat / page rotation.
+    """
+    global _LATEST_LHM
+    deadline = time.monotonic()
+    while True:
+        try:
+            _LATEST_LHM = lhm_read_metrics()
+        except Exception as e:
+            log(f"LHM prefetch failed: {e}")
+            _LATEST_LHM = None
+        _LHM_READY_EVT.set()
+
+        # Fixed rate (fetch + parse time included); if behind, fetch again right away
+        deadline += UPDATE_SECONDS
+        now = time.monotonic()
+        if deadline <= now:
+            deadline = now
+        time.sleep(deadline - now)
+
+
+def start_lhm_prefetch() -> None:
+    threading.Thread(target=_lhm_prefetch_loop, name="lhm-prefetch", daemon=True).start()
+
+
+# ============================================================
+# Physical RAM (Windows API, psutil fallback)
+# ============================================================
+
+class MEMORYSTATUSEX(ctypes.Structure):
+    _fields_ = [
+        ("dwLength", ctypes.c_ulong),
+        ("dwMemoryLoad", ctypes.c_ulong),
+        ("ullTotalPhys", ctypes.c_ulonglong),
+        ("ullAvailPhys", ctypes.c_ulonglong),
+        ("ullTotalPageFile", ctypes.c_ulonglong),
+        ("ullAvailPageFile", ctypes.c_ulonglong),
+        ("ullTotalVirtual", ctypes.c_ulonglong),
+        ("ullAvailVirtual", ctypes.c_ulonglong),
+        ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+    ]
+
+
+try:
+    _GlobalMemoryStatusEx = ctypes.windll.kernel32.GlobalMemoryStatusEx  # type: ignore[attr-defined]
+except Exception:
+    _GlobalMemoryStatusEx = None
+
+# Reused for every call
+_MEMSTATUS = MEMORYSTATUSEX()
+_MEMSTATUS.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+
+
+def read_ram_bytes() -> tuple[int, int]:
+    """
+    Returns (total, available) physical RAM in bytes.
+    Uses GlobalMemoryStatusEx directly; falls back to psutil.
+    """
+    if _GlobalMemoryStatusEx is not None and _GlobalMemoryStatusEx(ctypes.byref(_MEMSTATUS)):
+        return _MEMSTATUS.ullTotalPhys, _MEMSTATUS.ullAvailPhys
+    vm = psutil.virtual_memory()
+    return vm.total, vm.available
+
+
 # ============================================================
 # Runtime state
 # ============================================================
 
-MET: Dict[str, Optional[float]] = {
-    "cpu_clock_mhz": None,
-    "cpu_load": None,
-    "cpu_temp": None,
-    "gpu_load": None,
-    "gpu_temp": None,
-    "vram_used_gb": None,
-    "vram_total_gb": None,
-    "ram_used_gb": None,
-    "ram_total_gb": None,
-}
+class Metrics:
+    """
+    Current values shown on the OLED (None = unavailable).
+    Slotted: fixed attribute layout, no per-instance dict.
+    """
+
+    __slots__ = (
+        "cpu_clock_mhz",
+        "cpu_load",
+        "cpu_temp",
+        "gpu_load",
+        "gpu_temp",
+        "vram_used_gb",
+        "vram_total_gb",
+        "ram_used_gb",
+        "ram_total_gb",
+    )
+
+    def __init__(self) -> None:
+        self.cpu_clock_mhz: Optional[float] = None
+        self.cpu_load: Optional[float] = None
+        self.cpu_temp: Optional[float] = None
+        self.gpu_load: Optional[float] = None
+        self.gpu_temp: Optional[float] = None
+        self.vram_used_gb: Optional[float] = None
+        self.vram_total_gb: Optional[float] = None
+        self.ram_used_gb: Optional[float] = None
+        self.ram_total_gb: Optional[float] = None
+
+
+MET = Metrics()
 
 PAGE = 0
 
+# Last (event, line1, line2) successfully sent to the OLED
+_LAST_RENDER: Optional[tuple[str, str, str]] = None
+
 
 def update_metrics() -> None:
-    m = lhm_read_metrics()
+    m = _LATEST_LHM or _empty_lhm_metrics()
 
-    MET["cpu_clock_mhz"] = m["cpu_clock_mhz"]
-    MET["cpu_load"] = m["cpu_load"]
-    MET["cpu_temp"] = m["cpu_temp"]
+    MET.cpu_clock_mhz = m["cpu_clock_mhz"]
+    MET.cpu_load = m["cpu_load"]
+    MET.cpu_temp = m["cpu_temp"]
 
-    MET["gpu_load"] = m["gpu_load"]
-    MET["gpu_temp"] = m["gpu_temp"]
+    MET.gpu_load = m["gpu_load"]
+    MET.gpu_temp = m["gpu_temp"]
 
-    MET["vram_used_gb"] = mb_to_gb(m["vram_used_mb"])
-    MET["vram_total_gb"] = mb_to_gb(m["vram_total_mb"])
+    MET.vram_used_gb = mb_to_gb(m["vram_used_mb"])
+    MET.vram_total_gb = mb_to_gb(m["vram_total_mb"])
 
     # RAM from OS (accurate physical RAM, GiB)
     try:
-        vm = psutil.virtual_memory()
-        MET["ram_total_gb"] = vm.total / (1024**3)
-        MET["ram_used_gb"] = (vm.total - vm.available) / (1024**3)
+        total, available = read_ram_bytes()
+        MET.ram_total_gb = total / (1024**3)
+        MET.ram_used_gb = (total - available) / (1024**3)
     except Exception:
-        MET["ram_total_gb"] = None
-        MET["ram_used_gb"] = None
+        MET.ram_total_gb = None
+        MET.ram_used_gb = None
 
     if PAGE_LOCK:
         render_page()
 
 
 def render_page() -> None:
+    global _LAST_RENDER
+    # Hot path: same output as the fmt_* helpers, formatted inline from locals
+    # (int(round()) rather than ":.0f", which would print "-0")
     if PAGE == 0:
         # CPU page:
         # Line 1: CPU clock speed in GHz
         # Line 2: CPU load + temperature
-        l1 = f"CPU {fmt_ghz_from_mhz(MET['cpu_clock_mhz'])}"
-        l2 = f"CPU {fmt_pct(MET['cpu_load'])} {fmt_temp(MET['cpu_temp'])}"
-        send_screen(CPU_EVENT, l1, l2)
+        mhz = MET.cpu_clock_mhz
+        load = MET.cpu_load
+        temp = MET.cpu_temp
+        event_name = CPU_EVENT
+        l1 = "CPU ?" if mhz is None else f"CPU {mhz / 1000.0:.2f}GHz"
+        load_s = "?" if load is None else f"{int(round(load))}%"
+        temp_s = "?" if temp is None else f"{int(round(temp))}{_TEMP_UNIT}"
+        l2 = f"CPU {load_s} {temp_s}"
 
     elif PAGE == 1:
         # GPU page:
         # Line 1: GPU load + temperature
         # Line 2: VRAM total/used
-        l1 = f"GPU {fmt_pct(MET['gpu_load'])} {fmt_temp(MET['gpu_temp'])}"
-        l2 = f"VRAM {fmt_gb(MET['vram_total_gb'])}/{fmt_gb(MET['vram_used_gb'])}"
-        send_screen(GPU_EVENT, l1, l2)
+        load = MET.gpu_load
+        temp = MET.gpu_temp
+        total = MET.vram_total_gb
+        used = MET.vram_used_gb
+        event_name = GPU_EVENT
+        load_s = "?" if load is None else f"{int(round(load))}%"
+        temp_s = "?" if temp is None else f"{int(round(temp))}{_TEMP_UNIT}"
+        l1 = f"GPU {load_s} {temp_s}"
+        total_s = "?" if total is None else f"{total:.1f}G"
+        used_s = "?" if used is None else f"{used:.1f}G"
+        l2 = f"VRAM {total_s}/{used_s}"
 
     else:
         # RAM page:
         # Line 1: RAM total/used
         # Line 2: RAM usage bar
-        l1 = f"RAM {fmt_gb(MET['ram_total_gb'])}/{fmt_gb(MET['ram_used_gb'])}"
-        l2 = progress_bar(MET["ram_used_gb"], MET["ram_total_gb"])
-        send_screen(RAM_EVENT, l1, l2)
+        total = MET.ram_total_gb
+        used = MET.ram_used_gb
+        event_name = RAM_EVENT
+        total_s = "?" if total is None else f"{total:.1f}G"
+        used_s = "?" if used is None else f"{used:.1f}G"
+        l1 = f"RAM {total_s}/{used_s}"
+        l2 = progress_bar(used, total)
+
+    # Skip the POST if the OLED already shows exactly this frame
+    frame = (event_name, l1, l2)
+    if frame == _LAST_RENDER:
+        return
+    if send_screen(event_name, l1, l2):
+        _LAST_RENDER = frame
 
 
 def rotate_page() -> None:
@@ -626,6 +1036,31 @@ def wait_for_gamesense(timeout_s: int) -> bool:
     return False
 
 
+def run_jobs(jobs: list[tuple[float, Callable[[], None]]]) -> None:
+    """
+    Runs (interval_s, fn) jobs forever, sleeping until the nearest deadline.
+    Jobs due at the same time run in list order.
+    """
+    now = time.monotonic()
+    deadlines = [now + interval for interval, _ in jobs]
+
+    while True:
+        now = time.monotonic()
+        wait = min(deadlines) - now
+        if wait > 0:
+            time.sleep(wait)
+            now = time.monotonic()
+
+        for i, (interval, fn) in enumerate(jobs):
+            if now < deadlines[i]:
+                continue
+            fn()
+            # Fixed rate; if we fell behind, skip missed runs instead of bursting
+            deadlines[i] += interval
+            if deadlines[i] <= now:
+                deadlines[i] = now + interval
+
+
 def main() -> None:
     log("Starting OLED app...")
 
@@ -641,19 +1076,21 @@ def main() -> None:
 
     # Initial draw
     send_screen(CPU_EVENT, "LHM OLED", "starting...")
+    start_lhm_prefetch()
+    _LHM_READY_EVT.wait(timeout=UPDATE_SECONDS)
     update_metrics()
     render_page()
 
     # Schedulers
-    schedule.every(5).seconds.do(heartbeat)
-    schedule.every(UPDATE_SECONDS).seconds.do(update_metrics)
-    schedule.every(UPDATE_SECONDS).seconds.do(render_page)
-    schedule.every(PAGE_SECONDS).seconds.do(rotate_page)
-    schedule.every(10).seconds.do(watchdog)
-
-    while True:
-        schedule.run_pending()
-        time.sleep(0.2)
+    run_jobs(
+        [
+            (5, heartbeat),
+            (UPDATE_SECONDS, update_metrics),
+            (UPDATE_SECONDS, render_page),
+            (PAGE_SECONDS, rotate_page),
+            (10, watchdog),
+        ]
+    )
 
 
 if __name__ == "__main__":